@@ -6,6 +6,9 @@ from .solver import (
     create_series_table,
     create_parallel_table,
     e_decade_table,
+    BaseTable,
+    ComboTable,
+    Result,
 )
 
 __version__ = "0.2.0"
@@ -15,4 +18,7 @@ __all__ = [
     "create_series_table",
     "create_parallel_table",
     "e_decade_table",
+    "BaseTable",
+    "ComboTable",
+    "Result",
 ]
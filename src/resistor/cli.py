@@ -1,14 +1,19 @@
 """Command-line interface for resistor."""
 
 import argparse
+import math
+import re
 import sys
 
-from .solver import (
-    find_best_resistor_config,
-    create_table,
-    create_series_table,
-    create_parallel_table,
-)
+from .solver import find_best_resistor_config, create_table
+
+_MULTIPLIERS = {
+    'k': 1e3,
+    'm': 1e6,
+    'r': 1,  # Sometimes used for ohms
+}
+# Splits off at most one trailing suffix; the rest is left for float()
+_RESISTANCE_RE = re.compile(r"(.*?)([kmr]?)", re.DOTALL)
 
 
 def main():
@@ -21,6 +26,7 @@ Examples:
   resistor 4.7k              # Find configs for 4700 ohms
   resistor 2.2M -n 10        # Find top 10 configs for 2.2M ohms
   resistor 100 --tolerance 5 # Use 5% tolerance resistors
+  resistor 1580 --exhaustive # Score every resistor and combination
         """
     )
     parser.add_argument(
@@ -68,6 +74,11 @@ Examples:
         action="store_true",
         help="Only show parallel combinations"
     )
+    parser.add_argument(
+        "--exhaustive",
+        action="store_true",
+        help="Score every single resistor and every series/parallel combination instead of only those nearest the target"
+    )
 
     args = parser.parse_args()
 
@@ -77,7 +88,7 @@ Examples:
         print(f"Error: Invalid resistance value '{args.target}'", file=sys.stderr)
         sys.exit(1)
 
-    # Generate tables
+    # Generate base table; combinations are scored on the fly from it
     tolerance = args.tolerance / 100.0
     base_table = create_table(
         es=args.e_series,
@@ -85,28 +96,26 @@ Examples:
         decades=args.decades,
         tolerance=tolerance
     )
-    series_table = create_series_table(base_table)
-    parallel_table = create_parallel_table(base_table)
+
+    # Only search the config types requested
+    if args.single_only:
+        configs = ("single",)
+    elif args.series_only:
+        configs = ("series",)
+    elif args.parallel_only:
+        configs = ("parallel",)
+    else:
+        configs = ("single", "series", "parallel")
 
     # Find best configurations
     results = find_best_resistor_config(
         target,
         base_table,
-        series_table,
-        parallel_table,
-        n=args.num_results * 3  # Get extra to filter
+        n=args.num_results,
+        exhaustive=args.exhaustive,
+        configs=configs,
     )
 
-    # Filter by config type if requested
-    if args.single_only:
-        results = [r for r in results if r["config"] == "single"]
-    elif args.series_only:
-        results = [r for r in results if r["config"] == "series"]
-    elif args.parallel_only:
-        results = [r for r in results if r["config"] == "parallel"]
-
-    results = results[:args.num_results]
-
     # Display results
     print(f"\nTarget: {target:.6g} ohms")
     print(f"E-series: E{args.e_series}, Tolerance: ±{args.tolerance}%\n")
@@ -116,38 +125,27 @@ Examples:
         sys.exit(0)
 
     for rank, item in enumerate(results, 1):
-        resistors_str = " + ".join(format_resistance(r) for r in item["resistors"])
-        if item["config"] == "parallel":
-            resistors_str = " || ".join(format_resistance(r) for r in item["resistors"])
+        resistors_str = " + ".join(format_resistance(r) for r in item.resistors)
+        if item.config == "parallel":
+            resistors_str = " || ".join(format_resistance(r) for r in item.resistors)
 
-        error_pct = (item["nominal"] - target) / target * 100
+        error_pct = (item.nominal - target) / target * 100
 
-        print(f"#{rank}: {item['config'].upper()} {resistors_str}")
-        print(f"    Nominal: {item['nominal']:.6g} ohms ({error_pct:+.4f}%)")
-        print(f"    Range:   [{item['lo']:.6g}, {item['hi']:.6g}]")
+        print(f"#{rank}: {item.config.upper()} {resistors_str}")
+        print(f"    Nominal: {item.nominal:.6g} ohms ({error_pct:+.4f}%)")
+        print(f"    Range:   [{item.lo:.6g}, {item.hi:.6g}]")
         print()
 
 
 def parse_resistance(value: str) -> float | None:
     """Parse resistance value with optional k/M suffix."""
-    value = value.strip().lower()
-    multipliers = {
-        'k': 1e3,
-        'm': 1e6,
-        'r': 1,  # Sometimes used for ohms
-    }
-
-    multiplier = 1.0
-    for suffix, mult in multipliers.items():
-        if value.endswith(suffix):
-            value = value[:-1]
-            multiplier = mult
-            break
-
+    number, suffix = _RESISTANCE_RE.fullmatch(value.strip().lower()).groups()
     try:
-        return float(value) * multiplier
+        result = float(number) * _MULTIPLIERS.get(suffix, 1.0)
     except ValueError:
         return None
+    # Rejects "inf", "nan" and values that overflow once scaled
+    return result if math.isfinite(result) else None
 
 
 def format_resistance(value: float) -> str:
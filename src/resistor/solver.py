@@ -1,7 +1,11 @@
 """Core solver for finding optimal resistor configurations."""
 
+import bisect
 import heapq
 import math
+from array import array
+from functools import lru_cache
+from typing import NamedTuple
 
 # IEC 60063 standard values for E24 and below.
 # These diverge from the mathematical 10^(k/es) formula.
@@ -13,6 +17,45 @@ _IEC_E_VALUES = {
 }
 
 
+class BaseTable(NamedTuple):
+    """Base E-series table as parallel columns.
+
+    Each field is a contiguous array.array rather than a list of per-row
+    tuples.
+    """
+
+    lo: array
+    nom: array
+    hi: array
+
+
+class ComboTable(NamedTuple):
+    """Series or parallel combination table as parallel columns.
+
+    Stored column-wise like BaseTable, which is about 6x smaller than
+    per-row tuples for these O(N^2) tables.
+    """
+
+    lo: array
+    nom: array
+    hi: array
+    idx1: array
+    idx2: array
+
+
+class Result(NamedTuple):
+    """One resistor configuration returned by find_best_resistor_config."""
+
+    config: str  # "single", "series" or "parallel"
+    resistors: tuple[float, ...]
+    nominal: float
+    lo: float
+    hi: float
+    score: float
+    lower_tol_pct: float
+    upper_tol_pct: float
+
+
 def e_decade_table(es: int = 96, precision: int = 3, decade: int = 1) -> list[float]:
     """Generate one decade of E-series values with correct significant-figure rounding.
 
@@ -24,22 +67,24 @@ def e_decade_table(es: int = 96, precision: int = 3, decade: int = 1) -> list[fl
     Returns:
         List of rounded resistor values for one decade
     """
+    return list(_e_decade_values(es, precision, decade))
+
+
+@lru_cache(maxsize=None)
+def _e_decade_values(es: int, precision: int, decade: int) -> tuple[float, ...]:
+    """Cached, immutable body of e_decade_table."""
     if es in _IEC_E_VALUES:
         scale = 10 ** (decade - 1)
-        return [v * scale for v in _IEC_E_VALUES[es]]
+        return tuple(v * scale for v in _IEC_E_VALUES[es])
 
+    # log10(value) = k/es + decade - 1 with 0 <= k/es < 1, so every value
+    # in the decade has order decade - 1 and shares one rounding factor.
     scale = 10 ** (decade - 1)
-    result = []
-    for k in range(es):
-        value = 10.0 ** (k / es) * scale
-        order = math.floor(math.log10(abs(value)))
-        factor = 10.0 ** (precision - 1 - order)
-        rounded = round(value * factor) / factor
-        result.append(rounded)
-    return result
+    factor = 10.0 ** (precision - decade)
+    return tuple(round(10.0 ** (k / es) * scale * factor) / factor for k in range(es))
 
 
-def create_table(es: int = 96, precision: int = 3, decades: int = 6, tolerance: float = 0.01) -> list[tuple[float, float, float]]:
+def create_table(es: int = 96, precision: int = 3, decades: int = 6, tolerance: float = 0.01) -> BaseTable:
     """Create base E-series table with tolerance bounds.
 
     Args:
@@ -49,128 +94,340 @@ def create_table(es: int = 96, precision: int = 3, decades: int = 6, tolerance:
         tolerance: Tolerance as decimal (0.01 = 1%)
 
     Returns:
-        List of (lo, nominal, hi) tuples
+        BaseTable of (lo, nom, hi) float arrays
     """
-    nominals = []
+    nominals = array("d")
     for d in range(1, decades + 1):
-        nominals.extend(e_decade_table(es=es, precision=precision, decade=d))
-    return [(nom * (1 - tolerance), nom, nom * (1 + tolerance)) for nom in nominals]
+        nominals.extend(_e_decade_values(es, precision, d))
+    lo = array("d", [nom * (1 - tolerance) for nom in nominals])
+    hi = array("d", [nom * (1 + tolerance) for nom in nominals])
+    return BaseTable(lo, nominals, hi)
+
+
+def _series_row(base_table: BaseTable, i: int, start: int | None = None, stop: int | None = None) -> tuple[list, list, list]:
+    """Series combinations of base entry i with entries j in [start, stop).
+
+    start defaults to i and stop to the end of the table, giving every j >= i.
+    """
+    base_lo, base_nom, base_hi = base_table
+    lo_i, nom_i, hi_i = base_lo[i], base_nom[i], base_hi[i]
+    js = slice(i if start is None else start, stop)
+    return (
+        [lo_i + lo_j for lo_j in base_lo[js]],
+        [nom_i + nom_j for nom_j in base_nom[js]],
+        [hi_i + hi_j for hi_j in base_hi[js]],
+    )
+
 
+def _parallel_row(base_table: BaseTable, i: int, start: int | None = None, stop: int | None = None) -> tuple[list, list, list]:
+    """Parallel combinations of base entry i with entries j in [start, stop).
 
-def create_series_table(base_table: list[tuple[float, float, float]]) -> list[tuple[float, float, float, int, int]]:
+    start defaults to i and stop to the end of the table, giving every j >= i.
+    """
+    base_lo, base_nom, base_hi = base_table
+    lo_i, nom_i, hi_i = base_lo[i], base_nom[i], base_hi[i]
+    js = slice(i if start is None else start, stop)
+    return (
+        [(lo_i * lo_j) / (lo_i + lo_j) for lo_j in base_lo[js]],
+        [(nom_i * nom_j) / (nom_i + nom_j) for nom_j in base_nom[js]],
+        [(hi_i * hi_j) / (hi_i + hi_j) for hi_j in base_hi[js]],
+    )
+
+
+def _build_combo_table(base_table: BaseTable, build_row) -> ComboTable:
+    """Materialize every row build_row generates into a ComboTable."""
+    n = len(base_table.nom)
+    lo, nom, hi = array("d"), array("d"), array("d")
+    idx1, idx2 = array("i"), array("i")
+    for i in range(n):
+        row_lo, row_nom, row_hi = build_row(base_table, i)
+        lo.extend(row_lo)
+        nom.extend(row_nom)
+        hi.extend(row_hi)
+        idx1.extend([i] * (n - i))
+        idx2.extend(range(i, n))
+    return ComboTable(lo, nom, hi, idx1, idx2)
+
+
+def create_series_table(base_table: BaseTable) -> ComboTable:
     """Create all series combinations from base table.
 
+    Optional: find_best_resistor_config generates combinations on the fly
+    when no table is given. Prebuilding only pays off for exhaustive
+    scans repeated over many targets.
+
     Args:
-        base_table: List of (lo, nominal, hi) tuples
+        base_table: BaseTable from create_table
 
     Returns:
-        List of (lo, nominal, hi, idx1, idx2) tuples
+        ComboTable of (lo, nom, hi, idx1, idx2) arrays with N*(N+1)/2
+        entries each and idx1 <= idx2
     """
-    n = len(base_table)
-    result = []
-    for i in range(n):
-        lo_i, nom_i, hi_i = base_table[i]
-        for j in range(i, n):
-            lo_j, nom_j, hi_j = base_table[j]
-            result.append((lo_i + lo_j, nom_i + nom_j, hi_i + hi_j, i, j))
-    return result
+    return _build_combo_table(base_table, _series_row)
 
 
-def create_parallel_table(base_table: list[tuple[float, float, float]]) -> list[tuple[float, float, float, int, int]]:
+def create_parallel_table(base_table: BaseTable) -> ComboTable:
     """Create all parallel combinations from base table.
 
+    Optional, as for create_series_table.
+
     Args:
-        base_table: List of (lo, nominal, hi) tuples
+        base_table: BaseTable from create_table
 
     Returns:
-        List of (lo, nominal, hi, idx1, idx2) tuples
+        ComboTable of (lo, nom, hi, idx1, idx2) arrays with N*(N+1)/2
+        entries each and idx1 <= idx2
     """
-    n = len(base_table)
-    result = []
-    for i in range(n):
-        lo_i, nom_i, hi_i = base_table[i]
-        for j in range(i, n):
-            lo_j, nom_j, hi_j = base_table[j]
-            nom = (nom_i * nom_j) / (nom_i + nom_j)
-            lo = (lo_i * lo_j) / (lo_i + lo_j)
-            hi = (hi_i * hi_j) / (hi_i + hi_j)
-            result.append((lo, nom, hi, i, j))
-    return result
+    return _build_combo_table(base_table, _parallel_row)
+
+
+def _new_heap(n: int) -> list:
+    """Return a top-n heap for _select, pre-filled with n unbeatable-worst sentinels.
+
+    With the heap always full, _select needs a single comparison per entry
+    and no fill phase; _ranked drops whatever sentinels survive.
+    """
+    return [(-math.inf, 0)] * n
+
+
+def _select(heap: list, target: float, lo, nom, hi, start: int = 0) -> None:
+    """Score table entries against target, merging them into a top-n heap.
+
+    The score is inlined and the n best entries are held in a bounded
+    max-heap of (-score, -index) pairs, so no per-entry function call is
+    made and no score list is materialized. Entries that cannot beat the
+    current worst are rejected with a single comparison. Calling this
+    repeatedly with consecutive chunks of a table gives the same heap as
+    one call over the whole table.
+
+    Args:
+        heap: Heap from _new_heap, updated in place
+        target: Target resistance in ohms
+        lo: Lower bounds column
+        nom: Nominal values column
+        hi: Upper bounds column
+        start: Table index of the first entry in the columns
+    """
+    if not heap:
+        return
+    worst = -heap[0][0]
+    for k, (lo_k, nom_k, hi_k) in enumerate(zip(lo, nom, hi), start):
+        # Distance to the nearest bound plus a 1e-10 relative-error
+        # tiebreaker; outside the envelope the sign of target - nom is
+        # known, so each branch is a single multiply-add and divide.
+        if target < lo_k:
+            score = (lo_k - target + 1e-10 * (nom_k - target)) / nom_k
+        elif target > hi_k:
+            score = (target - hi_k + 1e-10 * (target - nom_k)) / nom_k
+        else:
+            score = 1e-10 * abs(target - nom_k) / nom_k
+        if score < worst:
+            heapq.heapreplace(heap, (-score, -k))
+            worst = -heap[0][0]
+
+
+def _ranked(heap: list) -> list[tuple[float, int]]:
+    """Return (score, index) pairs from a _select heap, best first."""
+    return [
+        (-neg_score, -neg_k)
+        for neg_score, neg_k in sorted(heap, reverse=True)
+        if neg_score != -math.inf
+    ]
+
+
+def _top_n(target: float, lo, nom, hi, n: int, start: int = 0, stop: int | None = None) -> list[tuple[float, int]]:
+    """Return the n best-scoring table entries as (score, index) pairs, best first.
+
+    Only entries in [start, stop) are scored; stop defaults to the end.
+    """
+    heap = _new_heap(n)
+    window = slice(start, stop)
+    _select(heap, target, lo[window], nom[window], hi[window], start)
+    return _ranked(heap)
+
+
+def _is_ascending(values) -> bool:
+    """Return whether values are in non-decreasing order."""
+    return all(a <= b for a, b in zip(values, values[1:]))
+
+
+def _has_uniform_tolerance(base_table: BaseTable) -> bool:
+    """Return whether every entry shares the same lo/nom and hi/nom ratios.
+
+    Ratios are compared to within a few ulps, so tables from create_table
+    qualify.
+    """
+    base_lo, base_nom, base_hi = base_table
+    if not base_nom:
+        return True
+    lo_ratio, hi_ratio = base_lo[0] / base_nom[0], base_hi[0] / base_nom[0]
+    return all(
+        math.isclose(lo_k / nom_k, lo_ratio, rel_tol=1e-12)
+        and math.isclose(hi_k / nom_k, hi_ratio, rel_tol=1e-12)
+        for lo_k, nom_k, hi_k in zip(base_lo, base_nom, base_hi)
+    )
+
+
+_CONFIGS = ("single", "series", "parallel")
+_ROW_BUILDERS = {"series": _series_row, "parallel": _parallel_row}
+
+
+def _partner_series(nom_i: float, value: float) -> float:
+    """Nominal that combines in series with nom_i to give value."""
+    return value - nom_i
+
+
+def _partner_parallel(nom_i: float, value: float) -> float:
+    """Nominal that combines in parallel with nom_i to give value (inf if none)."""
+    return value * nom_i / (nom_i - value) if value < nom_i else math.inf
+
+
+_PARTNER = {"series": _partner_series, "parallel": _partner_parallel}
+
+
+def _top_n_streamed(
+    target: float,
+    base_table: BaseTable,
+    config: str,
+    n: int,
+    nearest_only: bool = False,
+) -> list[tuple[float, int, int]]:
+    """Find the n best combinations without building the combination table.
+
+    Combinations are generated and scored one base entry at a time, so
+    peak memory is O(N) instead of O(N^2). Entries are numbered as in
+    the prebuilt tables, so ties resolve identically.
+
+    With nearest_only, each entry i is only combined with the partners
+    nearest the ideal one. This requires ascending base nominals and a
+    uniform tolerance (as from create_table): the combined nominal then
+    grows with the partner, the combination keeps the base lo/nom and
+    hi/nom ratios, and the score falls towards target and rises past it,
+    so the best n of a row sit within n places of the bisected ideal
+    partner. That makes the search O(N log N + N*n) instead of O(N^2).
+
+    Returns:
+        List of (score, idx1, idx2) tuples, sorted by score (best first)
+    """
+    build_row = _ROW_BUILDERS[config]
+    partner = _PARTNER[config]
+    base_nom = base_table.nom
+    size = len(base_nom)
+    starts = [i * size - i * (i - 1) // 2 for i in range(size)]
+
+    heap = _new_heap(n)
+    for i in range(size):
+        if nearest_only:
+            # One extra place each side absorbs rounding in the bisected partner
+            pos = max(i, bisect.bisect_left(base_nom, partner(base_nom[i], target), i))
+            j_start = max(i, pos - n - 1)
+            j_stop = min(size, pos + n + 1)
+        else:
+            j_start, j_stop = i, size
+        if j_start < j_stop:
+            _select(heap, target, *build_row(base_table, i, j_start, j_stop), starts[i] + j_start - i)
+
+    ranked = []
+    for score, k in _ranked(heap):
+        i = bisect.bisect_right(starts, k) - 1
+        ranked.append((score, i, i + k - starts[i]))
+    return ranked
 
 
 def find_best_resistor_config(
     target: float,
-    base_table: list[tuple[float, float, float]],
-    series_table: list[tuple[float, float, float, int, int]],
-    parallel_table: list[tuple[float, float, float, int, int]],
-    n: int = 3
-) -> list:
+    base_table: BaseTable,
+    series_table: ComboTable | None = None,
+    parallel_table: ComboTable | None = None,
+    n: int = 3,
+    exhaustive: bool = False,
+    configs: tuple[str, ...] = _CONFIGS,
+) -> list[Result]:
     """Find the best resistor configurations matching a target value.
 
+    Combination tables are optional. When one is omitted its
+    combinations are generated and scored on the fly from base_table,
+    which uses O(N) memory. Unless exhaustive is set, only the single
+    resistors nearest target and each base entry's nearest partners are
+    scored when target is positive, base nominals are ascending and every
+    entry has the same tolerance, as from create_table; this finds the
+    same results as scoring everything. Otherwise the base table is
+    scored in full, as are prebuilt tables.
+
     Args:
         target: Target resistance in ohms
-        base_table: List of (lo, nominal, hi) tuples
-        series_table: Series combinations list
-        parallel_table: Parallel combinations list
+        base_table: BaseTable from create_table
+        series_table: Series combinations from create_series_table, or None
+        parallel_table: Parallel combinations from create_parallel_table, or None
         n: Number of top results to return
+        exhaustive: Score every single resistor and generated combination
+        configs: Configurations to search, any of "single", "series"
+            and "parallel"
 
     Returns:
-        List of dicts with config details, sorted by score (best first)
+        List of Result tuples, sorted by score (best first)
+
+    Raises:
+        ValueError: If target is infinite or NaN, or configs names an
+            unknown config
     """
-    def get_score(lo, nom, hi):
-        if lo <= target <= hi:
-            dist = 0.0
-        else:
-            dist = min(abs(target - lo), abs(target - hi)) / nom
-        rel_err = abs(target - nom) / nom
-        return dist + 1e-10 * rel_err
+    # Non-finite targets score inf or nan everywhere, which never beats
+    # the heap sentinels and would silently return no results.
+    if not math.isfinite(target):
+        raise ValueError(f"target must be finite, got {target!r}")
+    # A bare string would pass the membership tests below by substring
+    if isinstance(configs, str) or not set(configs) <= set(_CONFIGS):
+        raise ValueError(f"configs must be a collection of {_CONFIGS}, got {configs!r}")
 
     def make_result(config, resistors, lo, nom, hi, score):
-        return {
-            "config": config,
-            "resistors": resistors,
-            "nominal": nom,
-            "lo": lo,
-            "hi": hi,
-            "score": score,
-            "lower_tol_pct": round((nom - lo) / nom * 100, 4),
-            "upper_tol_pct": round((hi - nom) / nom * 100, 4),
-        }
+        return Result(
+            config, resistors, nom, lo, hi, score,
+            lower_tol_pct=round((nom - lo) / nom * 100, 4),
+            upper_tol_pct=round((hi - nom) / nom * 100, 4),
+        )
+
+    # Rank lightweight (score, config, idx1, idx2) entries and only build
+    # Results for the n that survive the merge.
+    base_lo, base_nom, base_hi = base_table
+    # The bisected windows rely on scores falling towards target and
+    # rising past it, which mixed tolerances break. With target <= 0
+    # every score falls as the nominal grows, so there is no minimum to
+    # bisect for.
+    nearest_only = (
+        not exhaustive
+        and target > 0
+        and _is_ascending(base_nom)
+        and _has_uniform_tolerance(base_table)
+    )
 
     candidates = []
+    if "single" in configs:
+        start, stop = 0, len(base_nom)
+        if nearest_only:
+            # Singles score monotonically away from target; one extra place
+            # each side absorbs rounding, as for combinations.
+            pos = bisect.bisect_left(base_nom, target)
+            start, stop = max(0, pos - n - 1), min(stop, pos + n + 1)
+        candidates.extend((score, "single", k, k) for score, k in _top_n(target, *base_table, n, start, stop))
+    for config, table in (("series", series_table), ("parallel", parallel_table)):
+        if config not in configs:
+            continue
+        if table is None:
+            ranked = _top_n_streamed(target, base_table, config, n, nearest_only)
+        else:
+            lo, nom, hi, idx1, idx2 = table
+            ranked = [(score, idx1[k], idx2[k]) for score, k in _top_n(target, lo, nom, hi, n)]
+        candidates.extend((score, config, i, j) for score, i, j in ranked)
+    candidates.sort(key=lambda x: x[0])
 
-    # Single resistors
-    scored_singles = []
-    for row in base_table:
-        lo, nom, hi = row
-        score = get_score(lo, nom, hi)
-        scored_singles.append((score, lo, nom, hi))
-    for score, lo, nom, hi in heapq.nsmallest(n, scored_singles):
-        candidates.append(make_result("single", [nom], lo, nom, hi, score))
-
-    # Series combinations
-    scored_series = []
-    for row in series_table:
-        lo, nom, hi, idx1, idx2 = row
-        score = get_score(lo, nom, hi)
-        scored_series.append((score, lo, nom, hi, idx1, idx2))
-    for score, lo, nom, hi, idx1, idx2 in heapq.nsmallest(n, scored_series):
-        r1 = base_table[int(idx1)][1]
-        r2 = base_table[int(idx2)][1]
-        resistors = sorted([r1, r2])
-        candidates.append(make_result("series", resistors, lo, nom, hi, score))
-
-    # Parallel combinations
-    scored_parallel = []
-    for row in parallel_table:
-        lo, nom, hi, idx1, idx2 = row
-        score = get_score(lo, nom, hi)
-        scored_parallel.append((score, lo, nom, hi, idx1, idx2))
-    for score, lo, nom, hi, idx1, idx2 in heapq.nsmallest(n, scored_parallel):
-        r1 = base_table[int(idx1)][1]
-        r2 = base_table[int(idx2)][1]
-        resistors = sorted([r1, r2])
-        candidates.append(make_result("parallel", resistors, lo, nom, hi, score))
-
-    candidates.sort(key=lambda x: x["score"])
-    return candidates[:n]
+    results = []
+    for score, config, i, j in candidates[:n]:
+        if config == "single":
+            results.append(make_result(config, (base_nom[i],), base_lo[i], base_nom[i], base_hi[i], score))
+        else:
+            # A one-entry row reuses the table's combination formula
+            (lo,), (nom,), (hi,) = _ROW_BUILDERS[config](base_table, i, j, j + 1)
+            results.append(make_result(
+                config, tuple(sorted([base_nom[i], base_nom[j]])), lo, nom, hi, score
+            ))
+    return results
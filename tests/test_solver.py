@@ -1,16 +1,50 @@
 """Unit tests for resistor solver."""
 
+import bisect
 import math
+from array import array
 
 import pytest
 
 from resistor.solver import (
+    BaseTable,
     e_decade_table,
     create_table,
     create_series_table,
     create_parallel_table,
     find_best_resistor_config,
 )
+from resistor.cli import main, parse_resistance, format_resistance
+
+# IEC 60063 first-decade reference values
+_E6_REF = [1.0, 1.5, 2.2, 3.3, 4.7, 6.8]
+_E12_REF = [1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2]
+_E24_REF = [1.0, 1.1, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4, 2.7, 3.0,
+            3.3, 3.6, 3.9, 4.3, 4.7, 5.1, 5.6, 6.2, 6.8, 7.5, 8.2, 9.1]
+
+
+def assert_sorted_subset(small, large):
+    """Assert each value of small is in ascending list large, up to float rounding."""
+    for value in small:
+        pos = bisect.bisect_left(large, value * (1 - 1e-9))
+        assert pos < len(large) and math.isclose(large[pos], value), f"{value} not found"
+
+
+def mixed_tolerance_table(nominals, tolerances):
+    """Build a BaseTable with a per-entry tolerance."""
+    return BaseTable(
+        array("d", [nom * (1 - tol) for nom, tol in zip(nominals, tolerances)]),
+        array("d", nominals),
+        array("d", [nom * (1 + tol) for nom, tol in zip(nominals, tolerances)]),
+    )
+
+
+def assert_combinations(base, table, combine, rel_tol):
+    """Assert every lo/nom/hi entry of table is combine() of its two base entries."""
+    for lo, nom, hi, idx1, idx2 in zip(*table):
+        for value, column in ((lo, base.lo), (nom, base.nom), (hi, base.hi)):
+            expected = combine(column[idx1], column[idx2])
+            assert abs(value - expected) <= rel_tol * abs(expected)
 
 
 class TestEDecadeTable:
@@ -31,12 +65,13 @@ class TestEDecadeTable:
         result = e_decade_table(es=96, decade=1)
         assert result[0] == 1.0
 
-    def test_decade_scaling(self):
+    @pytest.mark.parametrize("es,rel_tol", [(6, 1e-10), (12, 1e-10), (24, 1e-10), (96, 1e-6)])
+    def test_decade_scaling(self, es, rel_tol):
         """Decade 2 values should be 10x decade 1."""
-        d1 = e_decade_table(es=96, decade=1)
-        d2 = e_decade_table(es=96, decade=2)
+        d1 = e_decade_table(es=es, decade=1)
+        d2 = e_decade_table(es=es, decade=2)
         for a, b in zip(d1, d2):
-            assert abs(b - a * 10) <= 1e-6 * abs(a * 10)
+            assert abs(b - a * 10) <= rel_tol * abs(a * 10)
 
     def test_values_are_increasing(self):
         """Values within a decade should be monotonically increasing."""
@@ -50,152 +85,126 @@ class TestEDecadeTable:
         for val in expected_values:
             assert any(math.isclose(r, val, rel_tol=0.01) for r in result), f"{val} not found"
 
-    def test_e24_iec_standard_values(self):
-        """E24 first-decade values should match IEC 60063 exactly."""
-        result = e_decade_table(es=24, decade=1)
-        expected = [1.0, 1.1, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4, 2.7, 3.0,
-                    3.3, 3.6, 3.9, 4.3, 4.7, 5.1, 5.6, 6.2, 6.8, 7.5, 8.2, 9.1]
-        assert result == expected
-
-    def test_e12_iec_standard_values(self):
-        """E12 first-decade values should match IEC 60063 exactly."""
-        result = e_decade_table(es=12, decade=1)
-        expected = [1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2]
-        assert result == expected
-
-    def test_e6_iec_standard_values(self):
-        """E6 first-decade values should match IEC 60063 exactly."""
-        result = e_decade_table(es=6, decade=1)
-        expected = [1.0, 1.5, 2.2, 3.3, 4.7, 6.8]
-        assert result == expected
+    @pytest.mark.parametrize("es,expected", [(24, _E24_REF), (12, _E12_REF), (6, _E6_REF)])
+    def test_iec_standard_values(self, es, expected):
+        """E24 and below first-decade values should match IEC 60063 exactly."""
+        assert e_decade_table(es=es, decade=1) == expected
 
     def test_e12_subset_of_e24(self):
         """E12 values should be a subset of E24."""
-        e12 = set(e_decade_table(es=12, decade=1))
-        e24 = set(e_decade_table(es=24, decade=1))
-        assert e12.issubset(e24)
+        assert_sorted_subset(e_decade_table(es=12, decade=1), e_decade_table(es=24, decade=1))
 
     def test_e6_subset_of_e12(self):
         """E6 values should be a subset of E12."""
-        e6 = set(e_decade_table(es=6, decade=1))
-        e12 = set(e_decade_table(es=12, decade=1))
-        assert e6.issubset(e12)
-
-    def test_e24_decade_scaling(self):
-        """E24 decade 2 values should be 10x decade 1."""
-        d1 = e_decade_table(es=24, decade=1)
-        d2 = e_decade_table(es=24, decade=2)
-        for a, b in zip(d1, d2):
-            assert abs(b - a * 10) <= 1e-10 * abs(a * 10)
+        assert_sorted_subset(e_decade_table(es=6, decade=1), e_decade_table(es=12, decade=1))
+
+    def test_returns_independent_list(self):
+        """Mutating a returned decade should not affect later calls."""
+        result = e_decade_table(es=96, decade=1)
+        result[0] = -1.0
+        assert e_decade_table(es=96, decade=1)[0] == 1.0
 
 
 class TestCreateTable:
     """Tests for create_table function."""
 
     def test_output_shape(self):
-        """Output should have 576 rows of 3-tuples."""
+        """Output should have 3 columns of 576 entries."""
         result = create_table(es=96, decades=6)
-        assert len(result) == 576
-        assert len(result[0]) == 3
+        assert len(result) == 3
+        assert all(len(col) == 576 for col in result)
 
     def test_columns_are_lo_nom_hi(self):
-        """Columns should be [lo, nominal, hi] with lo < nom < hi."""
+        """Columns should be (lo, nominal, hi) with lo < nom < hi."""
         result = create_table(es=96, decades=1)
-        for lo, nom, hi in result:
+        for lo, nom, hi in zip(*result):
             assert lo < nom
             assert nom < hi
 
     def test_tolerance_bounds(self):
         """Tolerance bounds should match specified tolerance."""
         result = create_table(es=96, decades=1, tolerance=0.01)
-        for lo, nom, hi in result:
+        for lo, nom, hi in zip(*result):
             assert abs(lo - nom * 0.99) <= 1e-10 * abs(nom * 0.99)
             assert abs(hi - nom * 1.01) <= 1e-10 * abs(nom * 1.01)
 
     def test_custom_tolerance(self):
         """Custom tolerance should be applied correctly."""
         result = create_table(es=96, decades=1, tolerance=0.05)
-        for lo, nom, hi in result:
+        for lo, nom, hi in zip(*result):
             assert abs(lo - nom * 0.95) <= 1e-10 * abs(nom * 0.95)
             assert abs(hi - nom * 1.05) <= 1e-10 * abs(nom * 1.05)
 
     def test_range_coverage(self):
         """6 decades should cover 1 ohm to ~1M ohm."""
         result = create_table(es=96, decades=6)
-        noms = [row[1] for row in result]
+        noms = result[1]
         assert min(noms) == 1.0
         assert max(noms) > 900000
 
 
+@pytest.fixture(scope="module")
+def small_base():
+    """E24 single-decade base table shared by the combination-table tests."""
+    return create_table(es=24, decades=1)
+
+
 class TestCreateSeriesTable:
     """Tests for create_series_table function."""
 
-    def test_output_shape(self):
-        """Output should have N*(N+1)/2 rows of 5-tuples."""
-        base = create_table(es=24, decades=1)
-        result = create_series_table(base)
-        assert len(result) == 24 * 25 // 2
-        assert len(result[0]) == 5
-
-    def test_series_sum_correct(self):
-        """Series nominal should equal R1 + R2."""
-        base = create_table(es=24, decades=1)
-        result = create_series_table(base)
-        for i in [0, 100, 299]:
-            idx1, idx2 = int(result[i][3]), int(result[i][4])
-            expected = base[idx1][1] + base[idx2][1]
-            assert result[i][1] == expected
-
-    def test_indices_valid(self):
+    def test_output_shape(self, small_base):
+        """Output should have 5 columns of N*(N+1)/2 entries."""
+        result = create_series_table(small_base)
+        assert len(result) == 5
+        assert all(len(col) == 24 * 25 // 2 for col in result)
+
+    def test_series_sum_correct(self, small_base):
+        """Every series entry should equal R1 + R2, in all three columns."""
+        result = create_series_table(small_base)
+        assert_combinations(small_base, result, lambda r1, r2: r1 + r2, rel_tol=0.0)
+
+    def test_indices_valid(self, small_base):
         """Stored indices should be valid and idx1 <= idx2."""
-        base = create_table(es=24, decades=1)
-        result = create_series_table(base)
-        for row in result:
-            assert 0 <= int(row[3]) <= int(row[4]) < len(base)
+        result = create_series_table(small_base)
+        for idx1, idx2 in zip(result.idx1, result.idx2):
+            assert 0 <= idx1 <= idx2 < len(small_base.nom)
 
 
 class TestCreateParallelTable:
     """Tests for create_parallel_table function."""
 
-    def test_output_shape(self):
-        """Output should have N*(N+1)/2 rows of 5-tuples."""
-        base = create_table(es=24, decades=1)
-        result = create_parallel_table(base)
-        assert len(result) == 24 * 25 // 2
-        assert len(result[0]) == 5
-
-    def test_parallel_formula_correct(self):
-        """Parallel nominal should equal (R1*R2)/(R1+R2)."""
-        base = create_table(es=24, decades=1)
-        result = create_parallel_table(base)
-        for i in [0, 100, 299]:
-            idx1, idx2 = int(result[i][3]), int(result[i][4])
-            r1, r2 = base[idx1][1], base[idx2][1]
-            expected = (r1 * r2) / (r1 + r2)
-            assert abs(result[i][1] - expected) <= 1e-10 * abs(expected)
-
-    def test_parallel_less_than_either(self):
-        """Parallel combination should be less than either resistor."""
-        base = create_table(es=24, decades=1)
-        result = create_parallel_table(base)
-        for i in [0, 100, 299]:
-            idx1, idx2 = int(result[i][3]), int(result[i][4])
-            r1, r2 = base[idx1][1], base[idx2][1]
-            assert result[i][1] < r1 or math.isclose(r1, r2)
-            assert result[i][1] < r2 or math.isclose(r1, r2)
+    def test_output_shape(self, small_base):
+        """Output should have 5 columns of N*(N+1)/2 entries."""
+        result = create_parallel_table(small_base)
+        assert len(result) == 5
+        assert all(len(col) == 24 * 25 // 2 for col in result)
+
+    def test_parallel_formula_correct(self, small_base):
+        """Every parallel entry should equal (R1*R2)/(R1+R2), in all three columns."""
+        result = create_parallel_table(small_base)
+        assert_combinations(small_base, result, lambda r1, r2: (r1 * r2) / (r1 + r2), rel_tol=1e-10)
+
+    def test_parallel_less_than_either(self, small_base):
+        """Every parallel combination should be less than either resistor."""
+        result = create_parallel_table(small_base)
+        for nom, idx1, idx2 in zip(result.nom, result.idx1, result.idx2):
+            r1, r2 = small_base.nom[idx1], small_base.nom[idx2]
+            assert nom < r1 or math.isclose(r1, r2)
+            assert nom < r2 or math.isclose(r1, r2)
+
+
+@pytest.fixture(scope="module")
+def tables():
+    """Create standard tables once for the module; tests only read them."""
+    base = create_table(es=96, decades=6)
+    series = create_series_table(base)
+    parallel = create_parallel_table(base)
+    return base, series, parallel
 
 
 class TestFindBestResistorConfig:
     """Tests for find_best_resistor_config function."""
 
-    @pytest.fixture
-    def tables(self):
-        """Create standard tables for testing."""
-        base = create_table(es=96, decades=6)
-        series = create_series_table(base)
-        parallel = create_parallel_table(base)
-        return base, series, parallel
-
     def test_returns_list(self, tables):
         """Should return a list."""
         base, series, parallel = tables
@@ -212,98 +221,180 @@ class TestFindBestResistorConfig:
         """Results should be sorted by score ascending."""
         base, series, parallel = tables
         result = find_best_resistor_config(1234, base, series, parallel, n=10)
-        scores = [r["score"] for r in result]
-        assert scores == sorted(scores)
+        assert all(a.score <= b.score for a, b in zip(result, result[1:]))
 
     def test_exact_match_has_zero_score(self, tables):
         """An exact E96 value should have score near zero."""
         base, series, parallel = tables
         result = find_best_resistor_config(1000, base, series, parallel, n=1)
-        assert result[0]["score"] < 1e-8
+        assert result[0].score < 1e-8
 
     def test_result_structure(self, tables):
-        """Results should have expected keys."""
+        """Results should have expected fields."""
         base, series, parallel = tables
         result = find_best_resistor_config(1000, base, series, parallel, n=1)
-        expected_keys = {"config", "resistors", "nominal", "lo", "hi", "score",
-                        "lower_tol_pct", "upper_tol_pct"}
-        assert set(result[0].keys()) == expected_keys
+        expected_fields = {"config", "resistors", "nominal", "lo", "hi", "score",
+                          "lower_tol_pct", "upper_tol_pct"}
+        assert set(result[0]._fields) == expected_fields
 
     def test_config_types(self, tables):
         """Config should be one of single/series/parallel."""
         base, series, parallel = tables
         result = find_best_resistor_config(1580, base, series, parallel, n=10)
         for r in result:
-            assert r["config"] in {"single", "series", "parallel"}
+            assert r.config in {"single", "series", "parallel"}
 
     def test_single_has_one_resistor(self, tables):
         """Single config should have one resistor."""
         base, series, parallel = tables
         result = find_best_resistor_config(1000, base, series, parallel, n=10)
-        singles = [r for r in result if r["config"] == "single"]
+        singles = [r for r in result if r.config == "single"]
         for s in singles:
-            assert len(s["resistors"]) == 1
+            assert len(s.resistors) == 1
 
     def test_series_parallel_have_two_resistors(self, tables):
         """Series and parallel configs should have two resistors."""
         base, series, parallel = tables
         result = find_best_resistor_config(1580, base, series, parallel, n=10)
-        combos = [r for r in result if r["config"] in {"series", "parallel"}]
+        combos = [r for r in result if r.config in {"series", "parallel"}]
         for c in combos:
-            assert len(c["resistors"]) == 2
+            assert len(c.resistors) == 2
 
     def test_tolerance_percentage_correct(self, tables):
-        """Tolerance percentages should match 1% tolerance."""
+        """Tolerance percentages of every result should match 1% tolerance."""
         base, series, parallel = tables
-        result = find_best_resistor_config(1000, base, series, parallel, n=1)
-        assert 0.99 < result[0]["lower_tol_pct"] < 1.01
-        assert 0.99 < result[0]["upper_tol_pct"] < 1.01
+        result = find_best_resistor_config(1000, base, series, parallel, n=10)
+        assert {r.config for r in result} >= {"single", "series", "parallel"}
+        assert all(0.99 < r.lower_tol_pct < 1.01 for r in result)
+        assert all(0.99 < r.upper_tol_pct < 1.01 for r in result)
 
     def test_target_outside_range(self, tables):
         """Should still return results for targets outside normal range."""
         base, series, parallel = tables
         result = find_best_resistor_config(0.1, base, series, parallel, n=1)
         assert len(result) == 1
-        assert result[0]["score"] > 0
+        assert result[0].score > 0
 
     def test_specific_value_1580(self, tables):
         """Verify known result for 1580 ohms."""
         base, series, parallel = tables
         result = find_best_resistor_config(1580, base, series, parallel, n=1)
-        assert result[0]["config"] == "single"
-        assert result[0]["nominal"] == 1580.0
-        assert result[0]["score"] < 1e-8
+        assert result[0].config == "single"
+        assert result[0].nominal == 1580.0
+        assert result[0].score < 1e-8
+
+    def test_streamed_matches_tables(self, tables):
+        """Omitting the combination tables should give identical results."""
+        base, series, parallel = tables
+        for target in [0.1, 47.3, 1580, 1234, 3e7]:
+            expected = find_best_resistor_config(target, base, series, parallel, n=10)
+            assert find_best_resistor_config(target, base, n=10) == expected
+            assert find_best_resistor_config(target, base, n=10, exhaustive=True) == expected
+
+    def test_mixed_tolerance_singles(self):
+        """A wide-tolerance single far from target should still be found."""
+        base = mixed_tolerance_table([700, 950, 980, 1020], [0.5, 0.01, 0.01, 0.01])
+        result = find_best_resistor_config(1000, base, n=1, configs=("single",))
+        assert result[0].resistors == (700.0,)
+        assert result == find_best_resistor_config(
+            1000, base, n=1, exhaustive=True, configs=("single",)
+        )
+
+    def test_mixed_tolerance_combinations(self):
+        """A wide-tolerance pair far from the ideal partner should still be found."""
+        nominals = [100, 700, *range(800, 900, 10), 910, 920]
+        tolerances = [0.001, 0.5] + [0.001] * (len(nominals) - 2)
+        base = mixed_tolerance_table(nominals, tolerances)
+        result = find_best_resistor_config(1000, base, n=1, configs=("series",))
+        assert result[0].resistors == (100.0, 700.0)
+        assert result == find_best_resistor_config(
+            1000, base, n=1, exhaustive=True, configs=("series",)
+        )
+
+    @pytest.mark.parametrize("config", ["single", "series", "parallel"])
+    def test_configs_restricts_search(self, tables, config):
+        """configs should limit results to the requested types."""
+        base, series, parallel = tables
+        for args in [(base,), (base, series, parallel)]:
+            result = find_best_resistor_config(1580, *args, n=5, configs=(config,))
+            assert len(result) == 5
+            assert all(r.config == config for r in result)
+
+    @pytest.mark.parametrize("config", ["single", "series", "parallel"])
+    @pytest.mark.parametrize("target", [-5, 0])
+    def test_non_positive_target_matches_exhaustive(self, tables, target, config):
+        """Non-positive targets should give the same results as an exhaustive search."""
+        base, _, _ = tables
+        result = find_best_resistor_config(target, base, n=3, configs=(config,))
+        assert result == find_best_resistor_config(
+            target, base, n=3, exhaustive=True, configs=(config,)
+        )
+
+    @pytest.mark.parametrize("configs", [("Series",), ("bogus",), "series"])
+    def test_unknown_configs_rejected(self, tables, configs):
+        """configs should only accept a collection of known config names."""
+        base, _, _ = tables
+        with pytest.raises(ValueError):
+            find_best_resistor_config(1580, base, configs=configs)
+
+    @pytest.mark.parametrize("target", [math.inf, -math.inf, math.nan])
+    def test_non_finite_target_rejected(self, tables, target):
+        """Non-finite targets should raise instead of returning no results."""
+        base, series, parallel = tables
+        with pytest.raises(ValueError):
+            find_best_resistor_config(target, base, series, parallel)
 
 
 class TestCLIParsing:
     """Tests for CLI helper functions."""
 
-    def test_parse_resistance_plain(self):
-        from resistor.cli import parse_resistance
-        assert parse_resistance("1000") == 1000.0
-
-    def test_parse_resistance_kilo(self):
-        from resistor.cli import parse_resistance
-        assert parse_resistance("4.7k") == 4700.0
-        assert parse_resistance("4.7K") == 4700.0
-
-    def test_parse_resistance_mega(self):
-        from resistor.cli import parse_resistance
-        assert parse_resistance("2.2M") == 2200000.0
-        assert parse_resistance("2.2m") == 2200000.0
-
-    def test_parse_resistance_invalid(self):
-        from resistor.cli import parse_resistance
-        assert parse_resistance("abc") is None
-
-    def test_format_resistance_ohms(self):
-        from resistor.cli import format_resistance
-        assert format_resistance(100) == "100"
-
-    def test_format_resistance_kilo(self):
-        from resistor.cli import format_resistance
-        assert format_resistance(4700) == "4.7k"
-
-    def test_format_resistance_mega(self):
-        from resistor.cli import format_resistance
-        assert format_resistance(2200000) == "2.2M"
+    @pytest.mark.parametrize("text,expected", [
+        ("1000", 1000.0),
+        ("4.7k", 4700.0),
+        ("4.7K", 4700.0),
+        ("2.2M", 2200000.0),
+        ("2.2m", 2200000.0),
+        ("10r", 10.0),
+        ("1e3", 1000.0),
+        ("abc", None),
+        ("k", None),
+        ("1\n2", None),
+        ("inf", None),
+        ("nan", None),
+        ("1e308k", None),
+    ])
+    def test_parse_resistance(self, text, expected):
+        assert parse_resistance(text) == expected
+
+    @pytest.mark.parametrize("value,expected", [
+        (100, "100"),
+        (4700, "4.7k"),
+        (2200000, "2.2M"),
+    ])
+    def test_format_resistance(self, value, expected):
+        assert format_resistance(value) == expected
+
+
+class TestCLIMain:
+    """Tests for the resistor command."""
+
+    def run(self, monkeypatch, capsys, *argv):
+        """Run main() with argv and return its stdout."""
+        monkeypatch.setattr("sys.argv", ["resistor", *argv])
+        main()
+        return capsys.readouterr().out
+
+    @pytest.mark.parametrize("flag,config", [
+        ("--single-only", "SINGLE"),
+        ("--series-only", "SERIES"),
+        ("--parallel-only", "PARALLEL"),
+    ])
+    def test_config_filter(self, monkeypatch, capsys, flag, config):
+        out = self.run(monkeypatch, capsys, "1580", "-n", "5", flag)
+        configs = [line.split()[1] for line in out.splitlines() if line.startswith("#")]
+        assert configs == [config] * 5
+
+    def test_exhaustive_matches_default(self, monkeypatch, capsys):
+        default = self.run(monkeypatch, capsys, "4.7k", "-n", "10")
+        assert default.count("\n#") == 10
+        assert self.run(monkeypatch, capsys, "4.7k", "-n", "10", "--exhaustive") == default